@@ -446,10 +446,10 @@ fn parse_dependency_spec(
 
     // Pattern: source:path@version or source:path
     // But only apply if it's not a local path
-    let remote_pattern = Regex::new(r"^([^:]+):([^@]+)(?:@(.+))?$")?;
+    static REMOTE_PATTERN: std::sync::LazyLock<Regex> =
+        std::sync::LazyLock::new(|| Regex::new(r"^([^:]+):([^@]+)(?:@(.+))?$").unwrap());
 
-    if !is_local_path && remote_pattern.is_match(spec) {
-        let captures = remote_pattern.captures(spec).unwrap();
+    if !is_local_path && let Some(captures) = REMOTE_PATTERN.captures(spec) {
         // Remote dependency
         let source = captures.get(1).unwrap().as_str().to_string();
         let path = captures.get(2).unwrap().as_str().to_string();
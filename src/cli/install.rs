@@ -723,6 +723,11 @@ fn detect_tag_movement(old_lockfile: &LockFile, new_lockfile: &LockFile, quiet:
         resource_type: ResourceType,
         quiet: bool,
     ) {
+        // Index old resources by display name once instead of scanning the list for every
+        // new resource; iterate in reverse so the first entry wins, as with `find`
+        let old_by_name: std::collections::HashMap<&str, &crate::lockfile::LockedResource> =
+            old_resources.iter().rev().map(|r| (r.display_name(), r)).collect();
+
         for new_resource in new_resources {
             // Skip if no version or resolved commit
             let Some(ref new_version) = new_resource.version else {
@@ -738,8 +743,7 @@ fn detect_tag_movement(old_lockfile: &LockFile, new_lockfile: &LockFile, quiet:
             }
 
             // Find the corresponding old resource
-            if let Some(old_resource) =
-                old_resources.iter().find(|r| r.display_name() == new_resource.display_name())
+            if let Some(old_resource) = old_by_name.get(new_resource.display_name())
                 && let (Some(old_version), Some(old_commit)) =
                     (&old_resource.version, &old_resource.resolved_commit)
             {
@@ -2,6 +2,7 @@
 
 use anyhow::Result;
 use colored::Colorize;
+use std::collections::HashSet;
 use std::path::Path;
 
 use crate::core::ResourceType;
@@ -44,7 +45,8 @@ pub async fn validate_lockfile(ctx: &mut ValidationContext<'_>, project_dir: &Pa
             let mut missing = Vec::new();
             let mut extra = Vec::new();
 
-            // Check for missing dependencies using unified interface
+            // Look up each resource type's entries once and check both directions
+            // against them, using a set of lockfile keys instead of a scan per name
             for resource_type in &[ResourceType::Agent, ResourceType::Snippet] {
                 let manifest_resources = ctx.manifest.get_resources(resource_type);
                 let lockfile_resources = lockfile.get_resources(resource_type);
@@ -54,29 +56,19 @@ pub async fn validate_lockfile(ctx: &mut ValidationContext<'_>, project_dir: &Pa
                     _ => unreachable!(),
                 };
 
+                let lockfile_keys: HashSet<&str> =
+                    lockfile_resources.iter().map(|e| e.display_name()).collect();
+
+                // Check for missing dependencies
                 for name in manifest_resources.keys() {
-                    if !lockfile_resources
-                        .iter()
-                        .any(|e| e.manifest_alias.as_ref().unwrap_or(&e.name) == name)
-                    {
+                    if !lockfile_keys.contains(name.as_str()) {
                         missing.push((name.clone(), type_name));
                     }
                 }
-            }
-
-            // Check for extra dependencies in lockfile
-            for resource_type in &[ResourceType::Agent, ResourceType::Snippet] {
-                let manifest_resources = ctx.manifest.get_resources(resource_type);
-                let lockfile_resources = lockfile.get_resources(resource_type);
-                let type_name = match resource_type {
-                    ResourceType::Agent => "agent",
-                    ResourceType::Snippet => "snippet",
-                    _ => unreachable!(),
-                };
 
+                // Check for extra dependencies in lockfile
                 for entry in lockfile_resources {
-                    let manifest_key = entry.manifest_alias.as_ref().unwrap_or(&entry.name);
-                    if !manifest_resources.contains_key(manifest_key) {
+                    if !manifest_resources.contains_key(entry.display_name()) {
                         extra.push((entry.name.clone(), type_name));
                     }
                 }
@@ -2,12 +2,16 @@
 
 use anyhow::Result;
 use colored::Colorize;
+use futures::stream::{self, StreamExt};
+use std::collections::HashMap;
 use std::path::Path;
 use std::sync::Arc;
 
 use crate::cache::Cache;
 use crate::cli::common::CommandContext;
 use crate::core::ResourceType;
+use crate::lockfile::{LockFile, LockedResource};
+use crate::manifest::ProjectConfig;
 use crate::markdown::reference_extractor::{extract_file_references, validate_file_references};
 use crate::templating::{RenderingMetadata, TemplateContextBuilder, TemplateRenderer};
 
@@ -72,160 +76,65 @@ pub async fn validate_templates(ctx: &mut ValidationContext<'_>, project_dir: &P
     let global_config = crate::config::GlobalConfig::load().await.unwrap_or_default();
     let max_content_file_size = Some(global_config.max_content_file_size);
 
-    // Collect all markdown resources from manifest
-    let mut template_results = Vec::new();
-    let mut templates_found = 0;
-    let mut templates_rendered = 0;
-
-    // Helper macro to validate template rendering
-    macro_rules! validate_resource_template {
-        ($name:expr, $entry:expr, $resource_type:expr) => {{
-            // Read the resource content
-            let content = if $entry.source.is_some() && $entry.resolved_commit.is_some() {
-                // Git resource - read from worktree
-                // Safe: checked is_some() above in the if condition
-                let source_name = $entry.source.as_ref().unwrap();
-                // Safe: checked is_some() above in the if condition
-                let sha = $entry.resolved_commit.as_ref().unwrap();
-                let url = match $entry.url.as_ref() {
-                    Some(u) => u,
-                    None => {
-                        template_results.push(format!("{}: Missing URL for Git resource", $name));
-                        continue;
-                    }
-                };
-
-                let cache_dir = match cache
-                    .get_or_create_worktree_for_sha(source_name, url, sha, Some($name))
-                    .await
-                {
-                    Ok(dir) => dir,
-                    Err(e) => {
-                        template_results.push(format!("{}: {}", $name, e));
-                        continue;
-                    }
-                };
-
-                let source_path = cache_dir.join(&$entry.path);
-                match tokio::fs::read_to_string(&source_path).await {
-                    Ok(c) => c,
-                    Err(e) => {
-                        template_results.push(format!(
-                            "{}: Failed to read file '{}': {}",
-                            $name,
-                            source_path.display(),
-                            e
-                        ));
-                        continue;
-                    }
-                }
-            } else {
-                // Local resource - read from project directory
-                let source_path = {
-                    let candidate = Path::new(&$entry.path);
-                    if candidate.is_absolute() {
-                        candidate.to_path_buf()
-                    } else {
-                        project_dir.join(candidate)
-                    }
-                };
-
-                match tokio::fs::read_to_string(&source_path).await {
-                    Ok(c) => c,
-                    Err(e) => {
-                        template_results.push(format!(
-                            "{}: Failed to read file '{}': {}",
-                            $name,
-                            source_path.display(),
-                            e
-                        ));
-                        continue;
-                    }
-                }
-            };
-
-            // Check if it contains template syntax
-            let has_template_syntax =
-                content.contains("{{") || content.contains("{%") || content.contains("{#");
-
-            if !has_template_syntax {
-                continue; // Not a template
-            }
-
-            templates_found += 1;
-
-            // Build template context
-            let project_config = ctx.manifest.project.clone();
-            let context_builder = TemplateContextBuilder::new(
-                Arc::clone(&lockfile),
-                project_config,
-                Arc::clone(&cache),
-                project_dir.to_path_buf(),
-            );
-            // Use canonical name from lockfile entry, not manifest key
-            let resource_id = crate::lockfile::ResourceId::new(
-                $entry.name.clone(),
-                $entry.source.clone(),
-                $entry.tool.clone(),
-                $resource_type,
-                $entry.variant_inputs.hash().to_string(),
-            );
-            let context = match context_builder
-                .build_context(&resource_id, $entry.variant_inputs.json())
-                .await
-            {
-                Ok((c, _checksum)) => c,
-                Err(e) => {
-                    template_results.push(format!("{}: {}", $name, e));
-                    continue;
-                }
-            };
-
-            // Try to render
-            let mut renderer =
-                match TemplateRenderer::new(true, project_dir.to_path_buf(), max_content_file_size)
-                {
-                    Ok(r) => r,
-                    Err(e) => {
-                        template_results.push(format!("{}: {}", $name, e));
-                        continue;
-                    }
-                };
-
-            // Create rendering metadata for better error messages
-            let rendering_metadata = RenderingMetadata {
-                resource_name: $entry.name.clone(),
-                resource_type: $resource_type,
-                dependency_chain: vec![], // Could be enhanced to include parent info
-                source_path: Some($entry.path.clone().into()),
-                depth: 0,
-            };
-
-            match renderer.render_template(&content, &context, Some(&rendering_metadata)) {
-                Ok(_) => {
-                    templates_rendered += 1;
-                }
-                Err(e) => {
-                    template_results.push(format!("{}: {}", $name, e));
-                }
-            }
-        }};
-    }
+    // Validation runs several independent resources at a time
+    let concurrency = {
+        let cores = std::thread::available_parallelism().map(std::num::NonZero::get).unwrap_or(4);
+        std::cmp::max(10, cores * 2)
+    };
 
-    // Process each resource type
+    // Collect all markdown resources from manifest
     // Use manifest_alias (if present) when matching manifest keys to lockfile entries
+    let mut resources = Vec::new();
     for resource_type in
         &[ResourceType::Agent, ResourceType::Snippet, ResourceType::Command, ResourceType::Script]
     {
         let manifest_resources = ctx.manifest.get_resources(resource_type);
         let lockfile_resources = lockfile.get_resources(resource_type);
 
+        // Index lockfile entries by manifest key once rather than scanning them per
+        // manifest entry; iterate in reverse so the first matching entry wins
+        let entries_by_name: HashMap<&str, &LockedResource> =
+            lockfile_resources.iter().rev().map(|e| (e.display_name(), e)).collect();
+
         for name in manifest_resources.keys() {
-            if let Some(entry) = lockfile_resources
-                .iter()
-                .find(|e| e.manifest_alias.as_ref().unwrap_or(&e.name) == name)
-            {
-                validate_resource_template!(name, entry, *resource_type);
+            if let Some(&entry) = entries_by_name.get(name.as_str()) {
+                resources.push((name.as_str(), entry, *resource_type));
+            }
+        }
+    }
+
+    // Render templates concurrently; `buffered` keeps the collection order so
+    // errors are reported in the same order as a sequential pass
+    let env = TemplateCheckEnv {
+        lockfile: &lockfile,
+        cache: &cache,
+        project_config: ctx.manifest.project.as_ref(),
+        project_dir,
+        max_content_file_size,
+    };
+    let env = &env;
+    let checks: Vec<_> = stream::iter(resources)
+        .map(move |(name, entry, resource_type)| {
+            check_resource_template(name, entry, resource_type, env)
+        })
+        .buffered(concurrency)
+        .collect()
+        .await;
+
+    let mut template_results = Vec::new();
+    let mut templates_found = 0;
+    let mut templates_rendered = 0;
+    for check in checks {
+        match check {
+            TemplateCheck::NotTemplate => {}
+            TemplateCheck::Unreadable(error) => template_results.push(error),
+            TemplateCheck::Rendered => {
+                templates_found += 1;
+                templates_rendered += 1;
+            }
+            TemplateCheck::RenderFailed(error) => {
+                templates_found += 1;
+                template_results.push(error);
             }
         }
     }
@@ -273,104 +182,25 @@ pub async fn validate_templates(ctx: &mut ValidationContext<'_>, project_dir: &P
     let mut file_reference_errors = Vec::new();
     let mut total_references_checked = 0;
 
-    // Helper macro to validate file references in markdown resources
-    macro_rules! validate_file_references_in_resource {
-        ($name:expr, $entry:expr) => {{
-            // Read the resource content
-            let content = if $entry.source.is_some() && $entry.resolved_commit.is_some() {
-                // Git resource - read from worktree
-                // Safe: checked is_some() above in the if condition
-                let source_name = $entry.source.as_ref().unwrap();
-                // Safe: checked is_some() above in the if condition
-                let sha = $entry.resolved_commit.as_ref().unwrap();
-                let url = match $entry.url.as_ref() {
-                    Some(u) => u,
-                    None => {
-                        continue;
-                    }
-                };
-
-                let cache_dir = match cache
-                    .get_or_create_worktree_for_sha(source_name, url, sha, Some($name))
-                    .await
-                {
-                    Ok(dir) => dir,
-                    Err(_) => {
-                        continue;
-                    }
-                };
-
-                let source_path = cache_dir.join(&$entry.path);
-                match tokio::fs::read_to_string(&source_path).await {
-                    Ok(c) => c,
-                    Err(e) => {
-                        tracing::debug!(
-                            "Failed to read source file '{}' for reference validation: {}",
-                            source_path.display(),
-                            e
-                        );
-                        continue;
-                    }
-                }
-            } else {
-                // Local resource - read from installed location
-                let installed_path = project_dir.join(&$entry.installed_at);
-
-                match tokio::fs::read_to_string(&installed_path).await {
-                    Ok(c) => c,
-                    Err(e) => {
-                        tracing::debug!(
-                            "Failed to read installed file '{}' for reference validation: {}",
-                            installed_path.display(),
-                            e
-                        );
-                        continue;
-                    }
-                }
-            };
-
-            // Extract file references from markdown content
-            let references = extract_file_references(&content);
-
-            if !references.is_empty() {
-                total_references_checked += references.len();
-
-                // Validate each reference exists
-                match validate_file_references(&references, project_dir) {
-                    Ok(missing) => {
-                        for missing_ref in missing {
-                            file_reference_errors.push(format!(
-                                "{}: references non-existent file '{}'",
-                                $entry.installed_at, missing_ref
-                            ));
-                        }
-                    }
-                    Err(e) => {
-                        file_reference_errors.push(format!(
-                            "{}: failed to validate references: {}",
-                            $entry.installed_at, e
-                        ));
-                    }
-                }
-            }
-        }};
-    }
-
-    // Process each markdown resource type from lockfile
-    for entry in &lockfile.agents {
-        validate_file_references_in_resource!(&entry.name, entry);
-    }
-
-    for entry in &lockfile.snippets {
-        validate_file_references_in_resource!(&entry.name, entry);
-    }
-
-    for entry in &lockfile.commands {
-        validate_file_references_in_resource!(&entry.name, entry);
-    }
-
-    for entry in &lockfile.scripts {
-        validate_file_references_in_resource!(&entry.name, entry);
+    // Scan markdown resources concurrently; `buffered` keeps lockfile order so
+    // errors are reported deterministically
+    let cache_ref: &Cache = &cache;
+    let scans: Vec<_> = stream::iter(
+        lockfile
+            .agents
+            .iter()
+            .chain(&lockfile.snippets)
+            .chain(&lockfile.commands)
+            .chain(&lockfile.scripts),
+    )
+    .map(move |entry| scan_file_references(entry, cache_ref, project_dir))
+    .buffered(concurrency)
+    .collect()
+    .await;
+
+    for (references_checked, errors) in scans.into_iter().flatten() {
+        total_references_checked += references_checked;
+        file_reference_errors.extend(errors);
     }
 
     // Report file reference validation results
@@ -409,3 +239,213 @@ pub async fn validate_templates(ctx: &mut ValidationContext<'_>, project_dir: &P
         Err(anyhow::anyhow!("File reference validation failed"))
     }
 }
+
+/// Shared inputs for rendering resource templates during validation.
+struct TemplateCheckEnv<'a> {
+    lockfile: &'a Arc<LockFile>,
+    cache: &'a Arc<Cache>,
+    project_config: Option<&'a ProjectConfig>,
+    project_dir: &'a Path,
+    max_content_file_size: Option<u64>,
+}
+
+/// Outcome of validating the template rendering of a single resource.
+enum TemplateCheck {
+    /// The resource contains no template syntax.
+    NotTemplate,
+    /// The resource could not be located or read.
+    Unreadable(String),
+    /// The resource is a template and rendered successfully.
+    Rendered,
+    /// The resource is a template and failed to render.
+    RenderFailed(String),
+}
+
+/// Reads a single resource and, if it contains template syntax, renders it.
+///
+/// Git resources are read from their worktree and local resources from the
+/// project directory. Error messages are prefixed with the manifest `name`.
+async fn check_resource_template(
+    name: &str,
+    entry: &LockedResource,
+    resource_type: ResourceType,
+    env: &TemplateCheckEnv<'_>,
+) -> TemplateCheck {
+    // Read the resource content
+    let content = if let (Some(source_name), Some(sha)) = (&entry.source, &entry.resolved_commit) {
+        // Git resource - read from worktree
+        let Some(url) = entry.url.as_ref() else {
+            return TemplateCheck::Unreadable(format!("{}: Missing URL for Git resource", name));
+        };
+
+        let cache_dir =
+            match env.cache.get_or_create_worktree_for_sha(source_name, url, sha, Some(name)).await
+            {
+                Ok(dir) => dir,
+                Err(e) => return TemplateCheck::Unreadable(format!("{}: {}", name, e)),
+            };
+
+        let source_path = cache_dir.join(&entry.path);
+        match tokio::fs::read_to_string(&source_path).await {
+            Ok(c) => c,
+            Err(e) => {
+                return TemplateCheck::Unreadable(format!(
+                    "{}: Failed to read file '{}': {}",
+                    name,
+                    source_path.display(),
+                    e
+                ));
+            }
+        }
+    } else {
+        // Local resource - read from project directory
+        let source_path = {
+            let candidate = Path::new(&entry.path);
+            if candidate.is_absolute() {
+                candidate.to_path_buf()
+            } else {
+                env.project_dir.join(candidate)
+            }
+        };
+
+        match tokio::fs::read_to_string(&source_path).await {
+            Ok(c) => c,
+            Err(e) => {
+                return TemplateCheck::Unreadable(format!(
+                    "{}: Failed to read file '{}': {}",
+                    name,
+                    source_path.display(),
+                    e
+                ));
+            }
+        }
+    };
+
+    // Check if it contains template syntax
+    let has_template_syntax =
+        content.contains("{{") || content.contains("{%") || content.contains("{#");
+
+    if !has_template_syntax {
+        return TemplateCheck::NotTemplate;
+    }
+
+    // Build template context
+    let context_builder = TemplateContextBuilder::new(
+        Arc::clone(env.lockfile),
+        env.project_config.cloned(),
+        Arc::clone(env.cache),
+        env.project_dir.to_path_buf(),
+    );
+    // Use canonical name from lockfile entry, not manifest key
+    let resource_id = crate::lockfile::ResourceId::new(
+        entry.name.clone(),
+        entry.source.clone(),
+        entry.tool.clone(),
+        resource_type,
+        entry.variant_inputs.hash().to_string(),
+    );
+    let context =
+        match context_builder.build_context(&resource_id, entry.variant_inputs.json()).await {
+            Ok((c, _checksum)) => c,
+            Err(e) => return TemplateCheck::RenderFailed(format!("{}: {}", name, e)),
+        };
+
+    // Try to render
+    let mut renderer =
+        match TemplateRenderer::new(true, env.project_dir.to_path_buf(), env.max_content_file_size)
+        {
+            Ok(r) => r,
+            Err(e) => return TemplateCheck::RenderFailed(format!("{}: {}", name, e)),
+        };
+
+    // Create rendering metadata for better error messages
+    let rendering_metadata = RenderingMetadata {
+        resource_name: entry.name.clone(),
+        resource_type,
+        dependency_chain: vec![], // Could be enhanced to include parent info
+        source_path: Some(entry.path.clone().into()),
+        depth: 0,
+    };
+
+    match renderer.render_template(&content, &context, Some(&rendering_metadata)) {
+        Ok(_) => TemplateCheck::Rendered,
+        Err(e) => TemplateCheck::RenderFailed(format!("{}: {}", name, e)),
+    }
+}
+
+/// Extracts and validates the file references of a single locked resource.
+///
+/// Reads the resource from its worktree (Git resources) or installed location
+/// (local resources). Resources that cannot be read are skipped.
+///
+/// # Returns
+///
+/// The number of references checked and the error messages for any broken
+/// references, or `None` if the resource was skipped.
+async fn scan_file_references(
+    entry: &LockedResource,
+    cache: &Cache,
+    project_dir: &Path,
+) -> Option<(usize, Vec<String>)> {
+    // Read the resource content
+    let content = if let (Some(source_name), Some(sha)) = (&entry.source, &entry.resolved_commit) {
+        // Git resource - read from worktree
+        let url = entry.url.as_ref()?;
+        let cache_dir = cache
+            .get_or_create_worktree_for_sha(source_name, url, sha, Some(&entry.name))
+            .await
+            .ok()?;
+
+        let source_path = cache_dir.join(&entry.path);
+        match tokio::fs::read_to_string(&source_path).await {
+            Ok(c) => c,
+            Err(e) => {
+                tracing::debug!(
+                    "Failed to read source file '{}' for reference validation: {}",
+                    source_path.display(),
+                    e
+                );
+                return None;
+            }
+        }
+    } else {
+        // Local resource - read from installed location
+        let installed_path = project_dir.join(&entry.installed_at);
+
+        match tokio::fs::read_to_string(&installed_path).await {
+            Ok(c) => c,
+            Err(e) => {
+                tracing::debug!(
+                    "Failed to read installed file '{}' for reference validation: {}",
+                    installed_path.display(),
+                    e
+                );
+                return None;
+            }
+        }
+    };
+
+    // Extract file references from markdown content
+    let references = extract_file_references(&content);
+    let mut errors = Vec::new();
+
+    if !references.is_empty() {
+        // Validate each reference exists
+        match validate_file_references(&references, project_dir) {
+            Ok(missing) => {
+                for missing_ref in missing {
+                    errors.push(format!(
+                        "{}: references non-existent file '{}'",
+                        entry.installed_at, missing_ref
+                    ));
+                }
+            }
+            Err(e) => {
+                errors
+                    .push(format!("{}: failed to validate references: {}", entry.installed_at, e));
+            }
+        }
+    }
+
+    Some((references.len(), errors))
+}
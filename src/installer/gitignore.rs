@@ -307,65 +307,48 @@ pub fn update_gitignore(
     paths_to_ignore.insert("agpm.private.lock".to_string());
 
     // Read existing gitignore if it exists
-    let mut before_agpm_section = Vec::new();
-    let mut after_agpm_section = Vec::new();
-
-    if gitignore_path.exists() {
-        let content = fs::read_to_string(&gitignore_path)
+    let existing_content = if gitignore_path.exists() {
+        fs::read_to_string(&gitignore_path)
             .with_context(|| "Failed to read .gitignore file")
             .with_context(|| {
                 format!("Failed to read {}", sanitize_path_for_error(&gitignore_path))
-            })?;
-
-        let mut in_agpm_section = false;
-        let mut past_agpm_section = false;
+            })?
+    } else {
+        String::new()
+    };
 
-        for line in content.lines() {
-            // Support both AGPM and legacy CCPM markers for migration compatibility
-            if line == "# AGPM managed entries - do not edit below this line"
-                || line == "# CCPM managed entries - do not edit below this line"
-            {
-                in_agpm_section = true;
-                continue;
-            } else if line == "# End of AGPM managed entries"
-                || line == "# End of CCPM managed entries"
-            {
-                in_agpm_section = false;
-                past_agpm_section = true;
-                continue;
-            }
+    // Lines outside the AGPM section are borrowed from the existing content
+    let mut before_agpm_section: Vec<&str> = Vec::new();
+    let mut after_agpm_section: Vec<&str> = Vec::new();
+    let mut in_agpm_section = false;
+    let mut past_agpm_section = false;
 
-            if !in_agpm_section && !past_agpm_section {
-                // Preserve everything before AGPM section exactly as-is
-                before_agpm_section.push(line.to_string());
-            } else if in_agpm_section {
-                // Skip existing AGPM/CCPM entries (they'll be replaced)
-                // Continue to next line
-            } else {
-                // Preserve everything after AGPM section exactly as-is
-                after_agpm_section.push(line.to_string());
-            }
+    for line in existing_content.lines() {
+        // Support both AGPM and legacy CCPM markers for migration compatibility
+        if line == "# AGPM managed entries - do not edit below this line"
+            || line == "# CCPM managed entries - do not edit below this line"
+        {
+            in_agpm_section = true;
+            continue;
+        } else if line == "# End of AGPM managed entries" || line == "# End of CCPM managed entries"
+        {
+            in_agpm_section = false;
+            past_agpm_section = true;
+            continue;
         }
-    }
-
-    // Build the new content
-    let mut new_content = String::new();
 
-    // Add everything before AGPM section exactly as it was
-    // Build initial content efficiently
-    if !before_agpm_section.is_empty() {
-        // Add all lines before AGPM section at once
-        new_content.push_str(&before_agpm_section.join("\n"));
-        new_content.push('\n');
-        // Add blank line before AGPM section if the previous content doesn't end with one
-        if !before_agpm_section.last().unwrap().trim().is_empty() {
-            new_content.push('\n');
+        if !in_agpm_section && !past_agpm_section {
+            // Preserve everything before AGPM section exactly as-is
+            before_agpm_section.push(line);
+        } else if in_agpm_section {
+            // Skip existing AGPM/CCPM entries (they'll be replaced)
+            // Continue to next line
+        } else {
+            // Preserve everything after AGPM section exactly as-is
+            after_agpm_section.push(line);
         }
     }
 
-    // Add AGPM managed section
-    new_content.push_str("# AGPM managed entries - do not edit below this line\n");
-
     // Convert paths to gitignore format (relative to project root)
     // Sort paths for consistent output
     let mut sorted_paths: Vec<_> = paths_to_ignore.into_iter().collect();
@@ -387,38 +370,60 @@ pub fn update_gitignore(
         path_lines.push(normalized_path);
     }
 
-    // Add all paths at once
-    new_content.push_str(&path_lines.join("\n"));
-    new_content.push('\n');
-    new_content.push_str("# End of AGPM managed entries\n");
+    const NEW_FILE_HEADER: &str =
+        "# .gitignore - AGPM managed entries\n# AGPM entries are automatically generated\n\n";
+    const SECTION_START: &str = "# AGPM managed entries - do not edit below this line\n";
+    const SECTION_END: &str = "# End of AGPM managed entries";
+
+    // Write every section straight into one buffer sized for the final content,
+    // instead of joining intermediate line vectors. Besides the existing content,
+    // paths and markers, at most three newlines are added: a blank line before
+    // the section, the end marker's line break and a blank line after it.
+    let paths_len: usize = path_lines.iter().map(|p| p.len() + 1).sum();
+    let mut new_content = String::with_capacity(
+        existing_content.len()
+            + paths_len
+            + NEW_FILE_HEADER.len()
+            + SECTION_START.len()
+            + SECTION_END.len()
+            + 3,
+    );
+
+    let is_new_file = before_agpm_section.is_empty() && after_agpm_section.is_empty();
+    if is_new_file {
+        // This is a new file, add a basic header
+        new_content.push_str(NEW_FILE_HEADER);
+    } else {
+        // Add everything before AGPM section exactly as it was
+        for line in &before_agpm_section {
+            new_content.push_str(line);
+            new_content.push('\n');
+        }
+        // Add blank line before AGPM section if the previous content doesn't end with one
+        if before_agpm_section.last().is_some_and(|line| !line.trim().is_empty()) {
+            new_content.push('\n');
+        }
+    }
 
-    // Add everything after AGPM section exactly as it was
-    if !after_agpm_section.is_empty() {
-        new_content.push('\n');
-        // Add all lines after AGPM section at once
-        new_content.push_str(&after_agpm_section.join("\n"));
+    // Add AGPM managed section
+    new_content.push_str(SECTION_START);
+    for path in &path_lines {
+        new_content.push_str(path);
         new_content.push('\n');
     }
+    new_content.push_str(SECTION_END);
+
+    if !is_new_file {
+        new_content.push('\n');
 
-    // If this is a new file, add a basic header
-    if before_agpm_section.is_empty() && after_agpm_section.is_empty() {
-        // Reuse the already collected path_lines
-        let header_lines = [
-            "# .gitignore - AGPM managed entries",
-            "# AGPM entries are automatically generated",
-            "",
-            "# AGPM managed entries - do not edit below this line",
-        ];
-        let footer_lines = ["# End of AGPM managed entries"];
-
-        // Combine all sections efficiently
-        let all_lines: Vec<String> = header_lines
-            .iter()
-            .map(|&s| s.to_string())
-            .chain(path_lines)
-            .chain(footer_lines.iter().map(|&s| s.to_string()))
-            .collect();
-        new_content = all_lines.join("\n");
+        // Add everything after AGPM section exactly as it was
+        if !after_agpm_section.is_empty() {
+            new_content.push('\n');
+            for line in &after_agpm_section {
+                new_content.push_str(line);
+                new_content.push('\n');
+            }
+        }
     }
 
     // Write the updated gitignore
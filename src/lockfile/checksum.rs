@@ -5,6 +5,7 @@
 
 use anyhow::{Context, Result};
 use std::fs;
+use std::io;
 use std::path::Path;
 
 use super::{LockFile, ResourceId};
@@ -60,23 +61,24 @@ impl LockFile {
     ///
     /// # Performance
     ///
-    /// The method reads the entire file into memory before hashing.
-    /// For very large files (>100MB), consider streaming implementations
-    /// in future versions.
+    /// The file is streamed through the hasher in fixed-size chunks, so memory
+    /// use stays constant regardless of file size.
     pub fn compute_checksum(path: &Path) -> Result<String> {
         use sha2::{Digest, Sha256};
 
-        let content = fs::read(path).with_context(|| {
+        let read_context = || {
             format!(
                 "Cannot read file for checksum calculation: {}\n\n\
                     This error occurs when verifying file integrity.\n\
                     Check that the file exists and is readable.",
                 path.display()
             )
-        })?;
+        };
 
+        // Stream the file through the hasher instead of buffering it whole
+        let mut file = fs::File::open(path).with_context(read_context)?;
         let mut hasher = Sha256::new();
-        hasher.update(&content);
+        io::copy(&mut file, &mut hasher).with_context(read_context)?;
         let result = hasher.finalize();
 
         Ok(format!("sha256:{}", hex::encode(result)))
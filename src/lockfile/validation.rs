@@ -4,7 +4,7 @@
 //! manifests, detect corruption, and identify when lockfiles need regeneration.
 
 use anyhow::Result;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::path::Path;
 
 use super::{LockFile, StalenessReason};
@@ -198,17 +198,18 @@ impl LockFile {
         // Check each resource type for duplicates
         for resource_type in crate::core::ResourceType::all() {
             let resources = self.get_resources(resource_type);
-            let mut seen_names = HashMap::new();
+            let mut seen_names = HashSet::new();
 
             for resource in resources {
-                if seen_names.contains_key(&resource.name) {
+                // `insert` reports whether the name was already present, so each
+                // name is hashed and looked up only once
+                if !seen_names.insert(&resource.name) {
                     return Ok(Some(StalenessReason::DuplicateEntries {
                         name: resource.name.clone(),
                         resource_type: *resource_type,
                         count: resources.iter().filter(|r| r.name == resource.name).count(),
                     }));
                 }
-                seen_names.insert(&resource.name, 0);
             }
         }
 
@@ -1504,8 +1504,11 @@ impl Manifest {
             }
         }
 
+        // Collect (and sort) all dependencies once; every check below walks the same list
+        let all_deps = self.all_dependencies();
+
         // Check that all referenced sources exist and dependencies have required fields
-        for (name, dep) in self.all_dependencies() {
+        for &(name, dep) in &all_deps {
             // Check for empty path
             if dep.get_path().is_empty() {
                 return Err(crate::core::AgpmError::ManifestValidationError {
@@ -1566,7 +1569,7 @@ impl Manifest {
         // Check for version conflicts (same dependency name with different versions)
         let mut seen_deps: std::collections::HashMap<String, String> =
             std::collections::HashMap::new();
-        for (name, dep) in self.all_dependencies() {
+        for &(name, dep) in &all_deps {
             if let Some(version) = dep.get_version() {
                 if let Some(existing_version) = seen_deps.get(name) {
                     if existing_version != version {
@@ -1625,15 +1628,16 @@ impl Manifest {
         // This ensures manifests are portable across different filesystems
         // Even though Linux supports case-sensitive files, we reject conflicts
         // to ensure the manifest works on Windows and macOS too
-        let mut normalized_names: std::collections::HashSet<String> =
-            std::collections::HashSet::new();
-
-        for (name, _) in self.all_dependencies() {
-            let normalized = name.to_lowercase();
-            if !normalized_names.insert(normalized.clone()) {
-                // Find the original conflicting name
-                for (other_name, _) in self.all_dependencies() {
-                    if other_name != name && other_name.to_lowercase() == normalized {
+        // Each name is lowercased exactly once; the map remembers which original
+        // spelling claimed a normalized name so a conflict can be reported directly
+        let mut normalized_names: std::collections::HashMap<String, &str> =
+            std::collections::HashMap::new();
+
+        for &(name, _) in &all_deps {
+            match normalized_names.entry(name.to_lowercase()) {
+                std::collections::hash_map::Entry::Occupied(entry) => {
+                    let other_name = *entry.get();
+                    if other_name != name {
                         return Err(crate::core::AgpmError::ManifestValidationError {
                             reason: format!(
                                 "Case conflict: '{name}' and '{other_name}' would map to the same file on case-insensitive filesystems. To ensure portability across platforms, resource names must be case-insensitively unique."
@@ -1642,6 +1646,9 @@ impl Manifest {
                         .into());
                     }
                 }
+                std::collections::hash_map::Entry::Vacant(entry) => {
+                    entry.insert(name);
+                }
             }
         }
 
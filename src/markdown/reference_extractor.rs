@@ -45,9 +45,19 @@
 use anyhow::Result;
 use regex::Regex;
 use std::path::Path;
+use std::sync::LazyLock;
 
 use crate::markdown::frontmatter::FrontmatterParser;
 
+/// Matches markdown links: `[text](target)`
+static LINK_REGEX: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"\[([^\]]+)\]\(([^)]+)\)").unwrap());
+
+/// Matches bare file paths with a `.md` extension
+static PATH_REGEX: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(r#"(?:^|\s|["'`])([./a-zA-Z_][\w./-]*\.md)(?:\s|["'`]|$)"#).unwrap()
+});
+
 /// A missing file reference found during validation.
 ///
 /// This struct captures information about a file reference that was found
@@ -126,13 +136,20 @@ impl MissingReference {
 pub fn extract_file_references(content: &str) -> Vec<String> {
     let mut references = Vec::new();
 
+    // Every extracted reference ends in `.md`, and stripping frontmatter and code
+    // blocks only removes text, so content without `.md` cannot yield any references
+    if !content.contains(".md") {
+        return references;
+    }
+
     // Remove frontmatter and code blocks to avoid extracting paths from metadata
     let content_without_frontmatter = remove_frontmatter(content);
     let content_without_code = remove_code_blocks(&content_without_frontmatter);
 
     // Extract markdown links: [text](path.md) - only .md files
-    if let Ok(link_regex) = Regex::new(r"\[([^\]]+)\]\(([^)]+)\)") {
-        for cap in link_regex.captures_iter(&content_without_code) {
+    // Cheap substring pre-screen: no `](` means no link can match
+    if content_without_code.contains("](") {
+        for cap in LINK_REGEX.captures_iter(&content_without_code) {
             if let Some(path) = cap.get(2) {
                 let path_str = path.as_str();
                 // Only include markdown files
@@ -145,13 +162,11 @@ pub fn extract_file_references(content: &str) -> Vec<String> {
 
     // Extract direct file paths with markdown extensions
     // Pattern: paths containing / with .md extension only
-    if let Ok(path_regex) = Regex::new(r#"(?:^|\s|["'`])([./a-zA-Z_][\w./-]*\.md)(?:\s|["'`]|$)"#) {
-        for cap in path_regex.captures_iter(&content_without_code) {
-            if let Some(path) = cap.get(1) {
-                let path_str = path.as_str();
-                if is_valid_file_reference(path_str) {
-                    references.push(path_str.to_string());
-                }
+    for cap in PATH_REGEX.captures_iter(&content_without_code) {
+        if let Some(path) = cap.get(1) {
+            let path_str = path.as_str();
+            if is_valid_file_reference(path_str) {
+                references.push(path_str.to_string());
             }
         }
     }
@@ -195,48 +210,47 @@ fn remove_frontmatter(content: &str) -> String {
 ///
 /// Content with code blocks removed (``` delimited)
 fn remove_code_blocks(content: &str) -> String {
-    let mut result = String::new();
+    let mut result = String::with_capacity(content.len());
     let mut in_code_block = false;
-    let mut chars = content.chars().peekable();
+    let mut rest = content;
 
-    while let Some(ch) = chars.next() {
-        // Check for code block delimiter (```)
-        if ch == '`' {
-            let mut backtick_count = 1;
+    // Jump from one backtick run to the next, copying the text in between in bulk
+    while let Some(start) = rest.find('`') {
+        push_segment(&mut result, &rest[..start], in_code_block);
 
-            // Count consecutive backticks
-            while chars.peek() == Some(&'`') {
-                backtick_count += 1;
-                chars.next();
-            }
+        // Count consecutive backticks
+        let backtick_count = rest[start..].bytes().take_while(|&b| b == b'`').count();
 
+        if backtick_count >= 3 {
             // Three or more backticks toggle code block mode
-            if backtick_count >= 3 {
-                in_code_block = !in_code_block;
-                // Replace code block delimiter with spaces
-                for _ in 0..backtick_count {
-                    result.push(' ');
-                }
-                continue;
-            }
+            in_code_block = !in_code_block;
+            // Replace code block delimiter with spaces
+            result.extend(std::iter::repeat_n(' ', backtick_count));
+        } else {
             // It's inline code (1-2 backticks), preserve it
-            for _ in 0..backtick_count {
-                result.push('`');
-            }
-            continue;
+            result.extend(std::iter::repeat_n('`', backtick_count));
         }
 
-        // Skip content inside code blocks
-        if in_code_block {
-            result.push(' '); // Maintain structure with spaces
-        } else {
-            result.push(ch);
-        }
+        rest = &rest[start + backtick_count..];
     }
+    push_segment(&mut result, rest, in_code_block);
 
     result
 }
 
+/// Append the text between two backtick runs.
+///
+/// The segment contains no backticks. Inside a fenced code block it is replaced
+/// with one space per character to maintain structure; outside a fence
+/// (including text within inline code) it is copied as-is.
+fn push_segment(result: &mut String, segment: &str, in_code_block: bool) {
+    if in_code_block {
+        result.extend(std::iter::repeat_n(' ', segment.chars().count()));
+    } else {
+        result.push_str(segment);
+    }
+}
+
 /// Check if a path string is a valid file reference to validate.
 ///
 /// This function filters out URLs, absolute paths, and other patterns
@@ -393,6 +407,29 @@ Or check http://example.com/page.html.
         assert_eq!(refs.len(), 0);
     }
 
+    #[test]
+    fn test_skip_content_without_markdown_references() {
+        let content = "See [site](https://example.com) and `scripts/build.sh`.";
+        assert!(extract_file_references(content).is_empty());
+
+        // `.md` only in frontmatter and a fenced code block passes the pre-screen,
+        // but nothing is left to match once those are stripped
+        let content = r#"---
+see: docs/meta.md
+---
+See [site](https://example.com).
+
+```markdown
+[guide](docs/guide.md) and `.agpm/snippets/code.md`
+```
+"#;
+        assert!(extract_file_references(content).is_empty());
+
+        // Same, with no link syntax left outside the code block
+        let content = "Plain text.\n\n```\n[guide](docs/guide.md)\n```\n";
+        assert!(extract_file_references(content).is_empty());
+    }
+
     #[test]
     fn test_skip_code_blocks() {
         let content = r#"
@@ -497,6 +534,15 @@ More normal text `.agpm/another.md`
         );
     }
 
+    #[test]
+    fn test_remove_code_blocks_preserves_layout() {
+        let content = "a `b` c\n```\nfn é() {}\n```\nd ``e`` f";
+        let cleaned = remove_code_blocks(content);
+
+        assert_eq!(cleaned, format!("a `b` c\n{}\nd ``e`` f", " ".repeat(17)));
+        assert_eq!(cleaned.chars().count(), content.chars().count());
+    }
+
     #[test]
     fn test_remove_frontmatter() {
         let content = r#"---
@@ -8,7 +8,7 @@ use anyhow::{Result, anyhow};
 use petgraph::algo::toposort;
 use petgraph::graph::{DiGraph, NodeIndex};
 use std::collections::{HashMap, HashSet, VecDeque};
-use std::fmt;
+use std::fmt::{self, Write};
 
 use crate::lockfile::lockfile_dependency_ref::LockfileDependencyRef;
 
@@ -292,25 +292,23 @@ impl DependencyGraph {
         } else {
             "├── "
         };
-        result.push_str(&format!("{}{}{}\n", prefix, connector, node.display_name()));
+        // Write straight into the shared buffer rather than formatting each line
+        // into a temporary String first
+        let _ = writeln!(result, "{}{}{}", prefix, connector, node.display_name());
+
+        let child_prefix = if is_last {
+            format!("{prefix}    ")
+        } else {
+            format!("{prefix}│   ")
+        };
 
         if !visited.insert(node.clone()) {
             // Already visited - indicate circular reference
-            let child_prefix = if is_last {
-                format!("{prefix}    ")
-            } else {
-                format!("{prefix}│   ")
-            };
-            result.push_str(&format!("{child_prefix}└── (circular reference)\n"));
+            let _ = writeln!(result, "{child_prefix}└── (circular reference)");
             return;
         }
 
         let deps = self.get_direct_deps(node);
-        let child_prefix = if is_last {
-            format!("{prefix}    ")
-        } else {
-            format!("{prefix}│   ")
-        };
 
         for (i, dep) in deps.iter().enumerate() {
             let is_last_child = i == deps.len() - 1;
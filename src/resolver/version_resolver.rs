@@ -997,6 +997,14 @@ pub fn sort_versions_deterministic(pairs: &mut [(String, Version)]) {
     });
 }
 
+/// Parses the version part of a tag (after any monorepo prefix) as a semantic
+/// version, accepting an optional leading `v` or `V`.
+fn parse_tag_version(version_part: &str) -> Option<Version> {
+    // Strip 'v' prefix from version part
+    let cleaned = version_part.trim_start_matches('v').trim_start_matches('V');
+    Version::parse(cleaned).ok()
+}
+
 /// Parses Git tags into semantic versions, filtering out non-semver tags.
 ///
 /// This function handles both prefixed and non-prefixed version tags,
@@ -1010,10 +1018,7 @@ pub fn parse_tags_to_versions(tags: Vec<String>) -> Vec<(String, Version)> {
         // Extract prefix and version part (handles both prefixed and unprefixed)
         let (_prefix, version_str) = crate::version::split_prefix_and_version(&tag);
 
-        // Strip 'v' prefix from version part
-        let cleaned = version_str.trim_start_matches('v').trim_start_matches('V');
-
-        if let Ok(version) = Version::parse(cleaned) {
+        if let Some(version) = parse_tag_version(version_str) {
             versions.push((tag, version));
         }
     }
@@ -1035,30 +1040,37 @@ pub fn find_best_matching_tag(constraint_str: &str, tags: Vec<String>) -> Result
     // Extract prefix from constraint
     let (constraint_prefix, version_str) = crate::version::split_prefix_and_version(constraint_str);
 
-    // Filter tags by prefix first
-    let filtered_tags: Vec<String> = tags
-        .into_iter()
-        .filter(|tag| {
-            let (tag_prefix, _) = crate::version::split_prefix_and_version(tag);
-            tag_prefix.as_ref() == constraint_prefix.as_ref()
-        })
-        .collect();
+    // Filter tags by prefix and parse their version part in the same pass, so each
+    // tag is split into prefix and version only once
+    let mut any_prefix_match = false;
+    let mut tag_versions: Vec<(String, Version)> = Vec::new();
+    for tag in tags {
+        let (tag_prefix, tag_version_str) = crate::version::split_prefix_and_version(&tag);
+        if tag_prefix != constraint_prefix {
+            continue;
+        }
+        any_prefix_match = true;
 
-    if filtered_tags.is_empty() {
+        if let Some(version) = parse_tag_version(tag_version_str) {
+            tag_versions.push((tag, version));
+        }
+    }
+
+    if !any_prefix_match {
         return Err(anyhow::anyhow!(
             "No tags found with matching prefix for constraint: {constraint_str}"
         ));
     }
 
-    // Parse filtered tags to versions
-    let tag_versions = parse_tags_to_versions(filtered_tags);
-
     if tag_versions.is_empty() {
         return Err(anyhow::anyhow!(
             "No valid semantic version tags found for constraint: {constraint_str}"
         ));
     }
 
+    // Sort deterministically: highest version first, tag name for ties
+    sort_versions_deterministic(&mut tag_versions);
+
     // Special case: wildcard (*) matches the highest available version
     if version_str == "*" {
         // tag_versions is already sorted highest first
@@ -1300,4 +1312,58 @@ mod tests {
         assert_eq!(WorktreeManager::group_key("source", "version"), "source::version");
         assert_eq!(WorktreeManager::group_key("community", "v1.0.0"), "community::v1.0.0");
     }
+
+    fn tags(names: &[&str]) -> Vec<String> {
+        names.iter().map(|name| (*name).to_string()).collect()
+    }
+
+    #[test]
+    fn test_parse_tag_version() {
+        assert_eq!(parse_tag_version("v1.2.3"), Some(Version::new(1, 2, 3)));
+        assert_eq!(parse_tag_version("V1.2.3"), Some(Version::new(1, 2, 3)));
+        assert_eq!(parse_tag_version("1.2.3"), Some(Version::new(1, 2, 3)));
+        assert_eq!(parse_tag_version("v1.2"), None);
+        assert_eq!(parse_tag_version("latest"), None);
+    }
+
+    #[test]
+    fn test_find_best_matching_tag_no_prefix_match() {
+        let err = find_best_matching_tag("agents-^1.0.0", tags(&["v1.0.0", "snippets-v1.0.0"]))
+            .unwrap_err();
+        assert!(
+            err.to_string().contains("No tags found with matching prefix"),
+            "unexpected error: {err}"
+        );
+    }
+
+    #[test]
+    fn test_find_best_matching_tag_no_valid_semver() {
+        // Tags share the prefix but none of them parse as semver
+        let err = find_best_matching_tag("agents-^1.0.0", tags(&["agents-v1.0", "agents-v2"]))
+            .unwrap_err();
+        assert!(
+            err.to_string().contains("No valid semantic version tags found"),
+            "unexpected error: {err}"
+        );
+    }
+
+    #[test]
+    fn test_find_best_matching_tag_prefixed_wildcard() {
+        let result = find_best_matching_tag(
+            "agents-*",
+            tags(&["agents-v1.0.0", "agents-v2.1.0", "agents-v2.0", "snippets-v9.0.0", "v5.0.0"]),
+        )
+        .unwrap();
+        assert_eq!(result, "agents-v2.1.0");
+    }
+
+    #[test]
+    fn test_find_best_matching_tag_prefixed_constraint() {
+        let result = find_best_matching_tag(
+            "agents-^1.0.0",
+            tags(&["agents-v1.0.0", "agents-v1.2.0", "agents-v2.0.0", "v1.5.0"]),
+        )
+        .unwrap();
+        assert_eq!(result, "agents-v1.2.0");
+    }
 }
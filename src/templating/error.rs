@@ -3,6 +3,7 @@
 //! This module provides structured error types for template rendering with detailed
 //! context information and user-friendly formatting.
 
+use std::fmt::Write;
 use std::path::PathBuf;
 
 use super::renderer::DependencyChainEntry;
@@ -184,7 +185,7 @@ fn format_variable_not_found_error(
     msg.push_str("ERROR: Template Variable Not Found\n\n");
 
     // Variable info
-    msg.push_str(&format!("Variable: {}\n\n", variable));
+    let _ = writeln!(msg, "Variable: {}\n", variable);
 
     // Dependency chain
     if !location.dependency_chain.is_empty() {
@@ -202,14 +203,15 @@ fn format_variable_not_found_error(
                 ""
             };
 
-            msg.push_str(&format!(
-                "{}{}{}: {}{}\n",
+            let _ = writeln!(
+                msg,
+                "{}{}{}: {}{}",
                 indent,
                 arrow,
                 format_resource_type(&entry.resource_type),
                 entry.name,
                 warning
-            ));
+            );
         }
         msg.push('\n');
     }
@@ -220,7 +222,7 @@ fn format_variable_not_found_error(
     } else if !suggestions.is_empty() {
         msg.push_str("Did you mean one of these?\n");
         for suggestion in suggestions.iter() {
-            msg.push_str(&format!("  - {}\n", suggestion));
+            let _ = writeln!(msg, "  - {}", suggestion);
         }
         msg.push('\n');
     }
@@ -239,15 +241,15 @@ fn format_variable_not_found_error(
         for (prefix, vars) in grouped.iter().take(5) {
             if vars.len() <= 3 {
                 for var in vars {
-                    msg.push_str(&format!("  {}\n", var));
+                    let _ = writeln!(msg, "  {}", var);
                 }
             } else {
-                msg.push_str(&format!("  {}.*  ({} variables)\n", prefix, vars.len()));
+                let _ = writeln!(msg, "  {}.*  ({} variables)", prefix, vars.len());
             }
         }
 
         if grouped.len() > MAX_VARIABLE_GROUPS_TO_DISPLAY {
-            msg.push_str(&format!("  ... and {} more\n", grouped.len() - 5));
+            let _ = writeln!(msg, "  ... and {} more", grouped.len() - 5);
         }
         msg.push('\n');
     }
@@ -271,18 +273,19 @@ fn format_missing_dependency_suggestion(variable: &str, location: &ErrorLocation
     let suggested_filename = dep_name.replace('_', "-");
 
     let mut msg = String::new();
-    msg.push_str(&format!(
-        "Suggestion: '{}' references '{}' but doesn't declare it as a dependency.\n\n",
+    let _ = writeln!(
+        msg,
+        "Suggestion: '{}' references '{}' but doesn't declare it as a dependency.\n",
         location.resource_name, dep_name
-    ));
+    );
 
-    msg.push_str(&format!("Fix: Add this to {} frontmatter:\n\n", location.resource_name));
+    let _ = writeln!(msg, "Fix: Add this to {} frontmatter:\n", location.resource_name);
     msg.push_str("---\n");
     msg.push_str("agpm:\n");
     msg.push_str("  templating: true\n");
     msg.push_str("dependencies:\n");
-    msg.push_str(&format!("  {}:\n", dep_type));
-    msg.push_str(&format!("    - path: ./{}.md\n", suggested_filename));
+    let _ = writeln!(msg, "  {}:", dep_type);
+    let _ = writeln!(msg, "    - path: ./{}.md", suggested_filename);
     msg.push_str("      install: false\n");
     msg.push_str("---\n\n");
 
@@ -300,14 +303,10 @@ fn format_circular_dependency_error(chain: &[DependencyChainEntry]) -> String {
 
     msg.push_str("Circular chain:\n");
     for entry in chain.iter() {
-        msg.push_str(&format!(
-            "  {} ({})\n",
-            entry.name,
-            format_resource_type(&entry.resource_type)
-        ));
+        let _ = writeln!(msg, "  {} ({})", entry.name, format_resource_type(&entry.resource_type));
         msg.push_str("  ↓\n");
     }
-    msg.push_str(&format!("  {} (circular reference)\n\n", chain[0].name));
+    let _ = writeln!(msg, "  {} (circular reference)\n", chain[0].name);
 
     msg.push_str("Suggestion: Remove the dependency that creates the cycle.\n");
     msg.push_str("Consider refactoring shared content into a separate resource.\n\n");
@@ -320,7 +319,7 @@ fn format_syntax_error(message: &str, location: &ErrorLocation) -> String {
     let mut msg = String::new();
 
     msg.push_str("ERROR: Template syntax error\n\n");
-    msg.push_str(&format!("Error: {}\n", message));
+    let _ = writeln!(msg, "Error: {}", message);
 
     // Display context lines if available
     if let Some(ref context_lines) = location.context_lines {
@@ -332,9 +331,9 @@ fn format_syntax_error(message: &str, location: &ErrorLocation) -> String {
                 let is_error_line = error_line == Some(*line_num);
 
                 if is_error_line {
-                    msg.push_str(&format!("→ {:4} | {}\n", line_num, content));
+                    let _ = writeln!(msg, "→ {:4} | {}", line_num, content);
                 } else {
-                    msg.push_str(&format!("  {:4} | {}\n", line_num, content));
+                    let _ = writeln!(msg, "  {:4} | {}", line_num, content);
                 }
             }
             msg.push('\n');
@@ -344,11 +343,8 @@ fn format_syntax_error(message: &str, location: &ErrorLocation) -> String {
     if !location.dependency_chain.is_empty() {
         msg.push_str("\nDependency chain:\n");
         for entry in &location.dependency_chain {
-            msg.push_str(&format!(
-                "  {} ({})\n",
-                entry.name,
-                format_resource_type(&entry.resource_type)
-            ));
+            let _ =
+                writeln!(msg, "  {} ({})", entry.name, format_resource_type(&entry.resource_type));
         }
     }
 
@@ -369,8 +365,8 @@ fn format_dependency_render_error(
     let mut msg = String::new();
 
     msg.push_str("ERROR: Dependency Render Failed\n\n");
-    msg.push_str(&format!("Dependency: {}\n", dependency));
-    msg.push_str(&format!("Error: {}\n\n", source));
+    let _ = writeln!(msg, "Dependency: {}", dependency);
+    let _ = writeln!(msg, "Error: {}\n", source);
 
     msg.push_str("Suggestion: Check the dependency file for template errors.\n");
     msg.push_str("The dependency may contain invalid template syntax or missing variables.\n\n");
@@ -386,8 +382,8 @@ fn format_content_filter_error(
     let mut msg = String::new();
 
     msg.push_str("ERROR: Content Filter Error\n\n");
-    msg.push_str(&format!("Depth: {}\n", depth));
-    msg.push_str(&format!("Error: {}\n\n", source));
+    let _ = writeln!(msg, "Depth: {}", depth);
+    let _ = writeln!(msg, "Error: {}\n", source);
 
     msg.push_str("Suggestion: Check the file being included by the content filter.\n");
     msg.push_str("The included file may contain template errors or circular dependencies.\n\n");
@@ -414,24 +414,17 @@ impl TemplateRenderer {
 
     /// Extract variable name from "Variable `foo` not found" message
     fn extract_variable_name(error_msg: &str) -> Option<String> {
-        // Pattern: "Variable `<name>` not found"
-        let re = Regex::new(r"Variable `([^`]+)` not found").ok()?;
-        if let Some(caps) = re.captures(error_msg) {
-            if let Some(m) = caps.get(1) {
-                return Some(m.as_str().to_string());
-            }
-        }
-
-        // Try other patterns if needed
-        // Pattern: "Unknown variable `foo`"
-        let re2 = Regex::new(r"Unknown variable `([^`]+)`").ok()?;
-        if let Some(caps) = re2.captures(error_msg) {
-            if let Some(m) = caps.get(1) {
-                return Some(m.as_str().to_string());
-            }
-        }
+        // Patterns: "Variable `<name>` not found" and "Unknown variable `<name>`",
+        // fused into one alternation so the message is scanned once
+        static VARIABLE_RE: std::sync::LazyLock<Regex> = std::sync::LazyLock::new(|| {
+            Regex::new(
+                r"Variable `(?P<not_found>[^`]+)` not found|Unknown variable `(?P<unknown>[^`]+)`",
+            )
+            .unwrap()
+        });
 
-        None
+        let caps = VARIABLE_RE.captures(error_msg)?;
+        caps.name("not_found").or_else(|| caps.name("unknown")).map(|m| m.as_str().to_string())
     }
 
     /// Extract available variables from Tera context
@@ -465,24 +458,21 @@ impl TemplateRenderer {
 
     /// Find similar variable names using Levenshtein distance
     fn find_similar_variables(target: &str, available: &[String]) -> Vec<String> {
+        let max_distance = target.len() * SIMILARITY_THRESHOLD_PERCENT / 100;
+
+        // Score by reference and drop distant names up front, so only the
+        // returned suggestions are cloned
         let mut scored: Vec<_> = available
             .iter()
-            .map(|var| {
-                let distance = levenshtein(target, var);
-                (var.clone(), distance)
-            })
+            .map(|var| (var, levenshtein(target, var)))
+            .filter(|(_, dist)| *dist <= max_distance)
             .collect();
 
         // Sort by distance (closest first)
         scored.sort_by_key(|(_, dist)| *dist);
 
         // Return top 3 suggestions within reasonable distance
-        scored
-            .into_iter()
-            .filter(|(_, dist)| *dist <= target.len() * SIMILARITY_THRESHOLD_PERCENT / 100)
-            .take(3)
-            .map(|(var, _)| var)
-            .collect()
+        scored.into_iter().take(3).map(|(var, _)| var.clone()).collect()
     }
 
     /// Extract context lines around an error location
@@ -494,24 +484,31 @@ impl TemplateRenderer {
         error_line: usize,
         context_size: usize,
     ) -> Vec<(usize, String)> {
-        let lines: Vec<&str> = content.lines().collect();
-        let total_lines = lines.len();
-
         // Tera uses 1-indexed line numbers
-        if error_line == 0 || error_line > total_lines {
+        if error_line == 0 {
             return Vec::new();
         }
 
-        // Calculate range (convert to 0-indexed for array access)
+        // Calculate range (0-indexed); only the lines in the window are visited,
+        // so the whole document is never collected just to be sliced
         let start = error_line.saturating_sub(context_size + 1);
-        let end = (error_line + context_size).min(total_lines);
+        let end = error_line + context_size;
 
         // Extract lines with their line numbers (1-indexed for display)
-        lines[start..end]
-            .iter()
+        let context: Vec<(usize, String)> = content
+            .lines()
             .enumerate()
-            .map(|(idx, line)| (start + idx + 1, line.to_string()))
-            .collect()
+            .skip(start)
+            .take(end - start)
+            .map(|(idx, line)| (idx + 1, line.to_string()))
+            .collect();
+
+        // The error line itself must exist in the content
+        if context.last().is_none_or(|(line_number, _)| *line_number < error_line) {
+            return Vec::new();
+        }
+
+        context
     }
 
     /// Extract line number from Tera error message
@@ -522,8 +519,9 @@ impl TemplateRenderer {
         let error_msg = format!("{:?}", error);
 
         // Look for pattern like "1:7" or "864:1" in the error message
-        let re = Regex::new(r"(\d+):(\d+)").ok()?;
-        if let Some(caps) = re.captures(&error_msg) {
+        static LINE_COL_RE: std::sync::LazyLock<Regex> =
+            std::sync::LazyLock::new(|| Regex::new(r"(\d+):(\d+)").unwrap());
+        if let Some(caps) = LINE_COL_RE.captures(&error_msg) {
             if let Some(line_str) = caps.get(1) {
                 return line_str.as_str().parse::<usize>().ok();
             }
@@ -753,4 +751,46 @@ Done.
             result
         );
     }
+
+    fn context_line_numbers(content: &str, error_line: usize) -> Vec<usize> {
+        TemplateRenderer::extract_context_lines(content, error_line, 2)
+            .into_iter()
+            .map(|(line_number, _)| line_number)
+            .collect()
+    }
+
+    #[test]
+    fn test_extract_context_lines_zero_line() {
+        // Tera line numbers are 1-indexed, so line 0 has no context
+        assert!(context_line_numbers("l1\nl2\nl3", 0).is_empty());
+    }
+
+    #[test]
+    fn test_extract_context_lines_past_eof() {
+        let content = "l1\nl2\nl3\nl4\nl5";
+        assert!(context_line_numbers(content, 6).is_empty());
+        assert!(context_line_numbers(content, 100).is_empty());
+        assert!(context_line_numbers("", 1).is_empty());
+    }
+
+    #[test]
+    fn test_extract_context_lines_last_line() {
+        // The window after the error line runs past EOF and is cut short
+        let lines = TemplateRenderer::extract_context_lines("l1\nl2\nl3\nl4\nl5", 5, 2);
+        assert_eq!(
+            lines,
+            vec![(3, "l3".to_string()), (4, "l4".to_string()), (5, "l5".to_string())]
+        );
+    }
+
+    #[test]
+    fn test_extract_context_lines_first_line() {
+        // The window before the error line saturates at the start of the content
+        assert_eq!(context_line_numbers("l1\nl2\nl3\nl4\nl5", 1), vec![1, 2, 3]);
+    }
+
+    #[test]
+    fn test_extract_context_lines_middle() {
+        assert_eq!(context_line_numbers("l1\nl2\nl3\nl4\nl5\nl6\nl7\nl8", 5), vec![3, 4, 5, 6, 7]);
+    }
 }
@@ -176,9 +176,9 @@ pub async fn get_directory_size(path: &Path) -> Result<u64> {
 ///
 /// # Performance
 ///
-/// This function reads the entire file into memory, so it may not be suitable
-/// for very large files. For processing multiple files, consider using
-/// [`calculate_checksums_parallel`] for better performance.
+/// The file is streamed through the hasher in fixed-size chunks, so memory use
+/// stays constant regardless of file size. For processing multiple files,
+/// consider using [`calculate_checksums_parallel`] for better performance.
 ///
 /// # Security
 ///
@@ -193,11 +193,11 @@ pub async fn get_directory_size(path: &Path) -> Result<u64> {
 /// - [`calculate_checksums_parallel`] for batch processing
 /// - [`hex`] crate for hexadecimal encoding
 pub fn calculate_checksum(path: &Path) -> Result<String> {
-    let content = fs::read(path)
-        .with_context(|| format!("Failed to read file for checksum: {}", path.display()))?;
+    let read_context = || format!("Failed to read file for checksum: {}", path.display());
 
+    let mut file = fs::File::open(path).with_context(read_context)?;
     let mut hasher = Sha256::new();
-    hasher.update(&content);
+    std::io::copy(&mut file, &mut hasher).with_context(read_context)?;
     let result = hasher.finalize();
 
     Ok(hex::encode(result))
@@ -482,33 +482,20 @@ pub fn compute_relative_path(base: &std::path::Path, target: &std::path::Path) -
     }
 
     // Target is outside base - need to compute path with ../
-    let base_components: Vec<_> = base.components().collect();
-    let target_components: Vec<_> = target.components().collect();
-
-    // Find the common prefix
-    let mut common_prefix_len = 0;
-    for (b, t) in base_components.iter().zip(target_components.iter()) {
-        if b == t {
-            common_prefix_len += 1;
-        } else {
-            break;
-        }
-    }
-
-    // Use slices instead of drain for better performance (avoid reallocation)
-    let base_remainder = &base_components[common_prefix_len..];
-    let target_remainder = &target_components[common_prefix_len..];
+    // Find the length of the common prefix without collecting either component list
+    let common_prefix_len =
+        base.components().zip(target.components()).take_while(|(b, t)| b == t).count();
 
     // Build the relative path
     let mut result = std::path::PathBuf::new();
 
     // Add ../ for each remaining base component
-    for _ in base_remainder {
+    for _ in base.components().skip(common_prefix_len) {
         result.push("..");
     }
 
     // Add the remaining target components
-    for component in target_remainder {
+    for component in target.components().skip(common_prefix_len) {
         if let Component::Normal(c) = component {
             result.push(c);
         }
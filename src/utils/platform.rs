@@ -285,10 +285,11 @@ pub fn resolve_path(path: &str) -> Result<PathBuf> {
     // Handle Windows-style %VAR% expansion differently
     let expanded_str = if is_windows() && path_str.contains('%') {
         // Manual Windows-style %VAR% expansion
-        let mut result = path_str.to_string();
-        let re = Regex::new(r"%([^%]+)%").unwrap();
+        static WINDOWS_VAR_RE: std::sync::LazyLock<Regex> =
+            std::sync::LazyLock::new(|| Regex::new(r"%([^%]+)%").unwrap());
 
-        for cap in re.captures_iter(&path_str) {
+        let mut result = path_str.to_string();
+        for cap in WINDOWS_VAR_RE.captures_iter(&path_str) {
             if let Some(var_name) = cap.get(1)
                 && let Ok(value) = std::env::var(var_name.as_str())
             {